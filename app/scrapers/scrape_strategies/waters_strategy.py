@@ -1,11 +1,32 @@
-from bs4 import BeautifulSoup
+import re
+import msgspec
+from bs4 import BeautifulSoup, SoupStrainer
 from app.unintrusive_scraper.page_scraper import PageScrapingStrategy
 
+class Water(msgspec.Struct, frozen=True, gc=False):
+  """
+  A body of water, as listed in one row of the Wikipedia table.
+  The fields are in the same order as the table columns, so an instance can be
+  built directly from a row's cells: `Water(*cells)`.
+  """
+  name: str
+  type_1: str
+  type_2: str
+  parent: str  # The body of water this one is a tributary of.
+  start_county: str
+  end_county: str
+
 class WatersStrategy(PageScrapingStrategy):
   """
   Implements a PageScrapingStrategy for extracting information about bodies of water
   from a specific Wikipedia page.
   """
+  # The data is a single table, so rows are streamed to `parse_rows` instead of building the whole page.
+  supports_row_stream = True
+  # When a soup is built for `parse`, only the "wikitable" tables are kept. The class attribute is
+  # matched as a raw string while parsing (e.g. "wikitable sortable"), hence the regular expression.
+  parse_only = SoupStrainer("table", class_=re.compile(r"(^|\s)wikitable(\s|$)"))
+
   def get_url(self) -> str:
     """
     Returns the URL path for the Wikipedia page listing bodies of water in New Brunswick.
@@ -13,7 +34,7 @@ class WatersStrategy(PageScrapingStrategy):
     """
     return "/wiki/List_of_bodies_of_water_of_New_Brunswick"
 
-  def parse(self, soup: BeautifulSoup) -> list[dict]:
+  def parse(self, soup: BeautifulSoup) -> list[Water]:
     """
     Parses the HTML content of the Wikipedia page to extract water body data.
 
@@ -21,31 +42,62 @@ class WatersStrategy(PageScrapingStrategy):
       soup: A BeautifulSoup object representing the parsed HTML of the page.
 
     Returns:
-      A list of dictionaries, where each dictionary represents a body of water
-      and contains extracted information like name, type, and location.
+      A list of Water records, each representing a body of water with
+      extracted information like name, type, and location. Empty if the
+      page has no data table; rows with fewer than 6 cells are skipped.
     """
     # Find the main data table on the page.
     table = soup.find("table", {"class": "wikitable"})
+    if table is None:
+        return []
     rows = table.find_all("tr")
 
     data = []
     # Iterate over table rows, skipping the header row (index 0).
     for row in rows[1:]:
         cols = row.find_all(["td"])
+        if len(cols) < 6:
+            continue
         # Extract text from each cell in the row.
-        name = cols[0].get_text(strip=True)
-        type1 = cols[1].get_text(strip=True)
-        type2 = cols[2].get_text(strip=True)
-        tributary_of = cols[3].get_text(strip=True)
-        start_county = cols[4].get_text(strip=True)
-        end_county = cols[5].get_text(strip=True)
-        data.append({
-            "name": name,
-            "type_1": type1,
-            "type_2": type2,
-            "parent": tributary_of,
-            "start_county": start_county,
-            "end_county": end_county
-        })
-
-    return data
\ No newline at end of file
+        data.append(Water(*(col.get_text(strip=True) for col in cols[:6])))
+
+    return data
+
+  def parse_rows(self, rows) -> list[Water]:
+    """
+    Extracts the same water body data as `parse`, from a stream of table rows.
+
+    Only the rows of the first "wikitable" table are used. The stream is abandoned
+    as soon as a row from another table shows up after it.
+
+    Args:
+      rows: An iterator of lxml `<tr>` elements, in document order.
+
+    Returns:
+      A list of Water records, in the same format (and with the same rows skipped)
+      as returned by `parse`.
+    """
+    table = None
+    data = []
+    for row in rows:
+        row_table = next(row.iterancestors("table"), None)
+        if row_table is None or "wikitable" not in (row_table.get("class") or "").split():
+            if table is not None:
+                # The target table has been read completely, stop early.
+                break
+            continue
+        if table is None:
+            # First row of the target table: the header row, which is skipped.
+            table = row_table
+            continue
+        if row_table is not table:
+            break
+
+        # Extract text from each cell in the row, like BeautifulSoup's get_text(strip=True).
+        cells = row.findall("td")
+        if len(cells) < 6:
+            continue
+        cols = ["".join(text.strip() for text in cell.itertext()) for cell in cells[:6]]
+        data.append(Water(*cols))
+
+    return data
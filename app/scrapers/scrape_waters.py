@@ -1,67 +1,85 @@
 from app.unintrusive_scraper.page_scraper import UnintrusivePageScraper
 from app.scrapers.scrape_strategies.waters_strategy import WatersStrategy
 from collections import defaultdict
+import msgspec
 
-def main():
+# Creates the scraper used by main(). Tests replace it to run main() without network access.
+_scraper_factory = UnintrusivePageScraper
 
-  # Defines a mapping from New Brunswick regions to their constituent counties.
-  # This is used to associate scraped water bodies with the correct regions.
-  new_brunswick_region_to_counties = {
-    "Restigouche": ["Restigouche"],
-    "Chaleur": ["Gloucester", "Restigouche"],
-    "Miramichi": ["Northumberland"],
-    "Southeast": ["Kent", "Westmorland", "Albert"],
-    "Inner Bay of Fundy": ["Saint John", "Kings", "Albert"],
-    "Lower Saint John": ["Carleton", "York", "Sunbury", "Saint John"],
-    "Southwest": ["Charlotte"],
-    "Upper Saint John": ["Madawaska", "Victoria", "Carleton"]
-  }
-
-  # Creates a reverse mapping from counties to regions.
-  # This allows for efficient lookup of regions based on a county.
-  county_to_regions = defaultdict(list)
-  for region, counties in new_brunswick_region_to_counties.items():
-    for c in counties:
-        county_to_regions[c].append(region)
+# Defines a mapping from New Brunswick regions to their constituent counties.
+# This is used to associate scraped water bodies with the correct regions.
+new_brunswick_region_to_counties = {
+  "Restigouche": ["Restigouche"],
+  "Chaleur": ["Gloucester", "Restigouche"],
+  "Miramichi": ["Northumberland"],
+  "Southeast": ["Kent", "Westmorland", "Albert"],
+  "Inner Bay of Fundy": ["Saint John", "Kings", "Albert"],
+  "Lower Saint John": ["Carleton", "York", "Sunbury", "Saint John"],
+  "Southwest": ["Charlotte"],
+  "Upper Saint John": ["Madawaska", "Victoria", "Carleton"]
+}
 
-  # Initializes the UnintrusivePageScraper with the base URL for Wikipedia.
-  # This scraper is designed to fetch web content without overloading the server.
-  scraper = UnintrusivePageScraper('https://en.wikipedia.org')
-  # Initializes the WatersStrategy, which defines how to extract water body data from Wikipedia pages.
-  waters_strategy = WatersStrategy()
-  waters = scraper.scrape(waters_strategy)
+# Creates a reverse mapping from counties to regions.
+# This allows for efficient lookup of regions based on a county.
+county_to_regions = defaultdict(list)
+for region, counties in new_brunswick_region_to_counties.items():
+  for c in counties:
+      county_to_regions[c].append(region)
 
-  results = []
+def transform_and_filter_water_data(waters, county_to_regions):
+  """
+  Turns the scraped water bodies into tabular rows, keeping only lakes and rivers.
+
+  Args:
+    waters: The Water records returned by WatersStrategy.
+    county_to_regions: A mapping from county names (without the " County" suffix)
+                       to the list of regions they belong to.
+
+  Returns:
+    A list of rows, each a list of [name, water type, region]. A water body spanning
+    several regions has one row per region.
+  """
+  rows = []
 
-  # Process the scraped water body data.
   for water in waters:
 
     # Filter out water bodies that are not lakes or rivers.
-    if water['type_1'].lower().strip() not in ['lake', 'river']:
+    type_1 = water.type_1.lower().strip()
+    if type_1 not in ['lake', 'river']:
       continue
 
-    # Create a base dictionary for the water body's data.
-    water_data = {
-      'name': water['name'],
-      'water_type': 'lakes, ponds and reservoirs' if water['type_1'] == 'lake' else 'rivers, brooks and streams'
-    }
+    water_type = 'lakes, ponds and reservoirs' if type_1 == 'lake' else 'rivers, brooks and streams'
 
     # Determine the regions associated with the water body, handling potential duplicates.
     # It uses the start and end counties of the water body to find all relevant regions.
     # The 'removesuffix' is used to clean up county names before lookup.
-    regions = set(county_to_regions[water['start_county'].removesuffix(' County')] + county_to_regions[water['end_county'].removesuffix(' County')])
+    regions = set(county_to_regions.get(water.start_county.removesuffix(' County'), []) + county_to_regions.get(water.end_county.removesuffix(' County'), []))
 
-    # Create a separate entry in the results list for each region the water body belongs to.
+    # Create a separate row for each region the water body belongs to.
     # This ensures that if a water body spans multiple regions, it's listed under each.
     for region in regions:
-      results.append(water_data | {
-        'region': region
-      })
-
-  # Convert the list of dictionaries into a list of lists (tabular data) for printing.
-  # Each inner list represents a row with name, water type, and region.
-  rows = [[result['name'], result['water_type'], result['region']] for result in results]
-  print(rows)
+      rows.append([water.name, water_type, region])
+
+  return rows
+
+def process(raw_rows):
+  """
+  Processes the water bodies scraped by WatersStrategy into the rows printed by this
+  script, using the New Brunswick regions (see `transform_and_filter_water_data`).
+  """
+  return transform_and_filter_water_data(raw_rows, county_to_regions)
+
+def main():
+
+  # Initializes the UnintrusivePageScraper with the base URL for Wikipedia.
+  # This scraper is designed to fetch web content without overloading the server.
+  scraper = _scraper_factory('https://en.wikipedia.org')
+  # Initializes the WatersStrategy, which defines how to extract water body data from Wikipedia pages.
+  waters_strategy = WatersStrategy()
+  rows = process(scraper.scrape(waters_strategy))
+
+  # Print the rows as JSON.
+  print(msgspec.json.encode(rows).decode())
 
 if __name__ == '__main__':
     main()
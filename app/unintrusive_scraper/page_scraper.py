@@ -1,11 +1,29 @@
 from abc import ABC, abstractmethod
+import asyncio
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 import time
 import random
 import urllib.robotparser
 import logging
 import os
+import tempfile
+import threading
+import zstandard
+
+# Optional dependency: with httpx and h2 installed (`pip install httpx[http2]`), `scrape_many`
+# fetches all pages over a single multiplexed HTTP/2 connection.
+try:
+    import httpx
+    import h2  # noqa: F401 (needed by httpx for HTTP/2)
+except ImportError:
+    httpx = None
 
 # Configure logging (important for debugging and monitoring)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -46,16 +64,102 @@ class PageScrapingStrategy(ABC):
         """
         pass
 
+    # Optional `bs4.SoupStrainer`. When set, the soup passed to `parse` is built only from the parts
+    # of the page it matches: BeautifulSoup skips everything else while parsing, which makes for a
+    # faster parse and a smaller tree.
+    parse_only = None
+
+    # Capability flag: strategies that only need the table rows of a page can set this to True
+    # and implement `parse_rows`. The scraper then streams the rows to the strategy while the page
+    # is being downloaded (or read from the cache) instead of building a whole BeautifulSoup tree.
+    supports_row_stream = False
+    # The elements streamed to `parse_rows`. Strategies whose data is not in table rows (e.g. list
+    # items, 'li') can change it; the scraper then streams those elements instead.
+    stream_tag = 'tr'
+
+    def parse_rows(self, rows) -> list[dict]:
+        """
+        Extracts data from a stream of table rows. Only called when `supports_row_stream` is True.
+
+        The rows are the page's `stream_tag` elements (`<tr>` by default), produced by lxml in
+        document order. Each row is cleared once the strategy moves on to the next one, so any data
+        needed from it must be extracted before advancing. A strategy may stop consuming the stream
+        as soon as it has what it needs.
+
+        Args:
+            rows (Iterator[lxml.html.HtmlElement]): The `stream_tag` elements of the page.
+
+        Returns:
+            list[dict]: The extracted data, as returned by `parse`.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support row streaming.")
+
+
+class _CacheReadError(Exception):
+    """Raised by `get_parsed_stream` when the cached copy of a page cannot be read or parsed."""
+
+
+class _PoliteRetry(Retry):
+    """
+    urllib3 retry policy that also waits before the first retry. Plain `Retry` retries the first
+    failure immediately and only backs off from the second one; here every retry waits at least
+    `backoff_factor` seconds (then 2x, 4x, ... as usual).
+    """
+    def get_backoff_time(self):
+        return max(super().get_backoff_time(), self.backoff_factor)
+
+
+class _CachingReader:
+    """
+    File-like wrapper around a streamed HTTP response body that decodes it with the response's
+    charset and copies every chunk read from it, re-encoded as UTF-8, into a cache file. Reads
+    return the same UTF-8 bytes, so streamed pages end up in the cache like fetched ones (cache
+    files are always UTF-8).
+    """
+    def __init__(self, stream, cache_file, encoding='utf-8'):
+        self._stream = stream
+        self._cache_file = cache_file
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    def read(self, size=-1):
+        while True:
+            data = self._stream.read(size)
+            text = self._decoder.decode(data, final=not data)
+            # A chunk ending inside a multi-byte character may decode to nothing; keep reading
+            # instead of returning b'', which would signal the end of the stream.
+            if text or not data:
+                break
+        data = text.encode('utf-8')
+        self._cache_file.write(data)
+        return data
+
+    def drain(self, chunk_size=64 * 1024):
+        """Reads (and caches) whatever is left of the stream."""
+        while self.read(chunk_size):
+            pass
+
+
 class UnintrusivePageScraper:
     """
     A web scraper designed to be respectful to web servers.
     Key features:
-    - Adheres to robots.txt rules to ensure allowed scraping paths.
+    - Adheres to robots.txt rules to ensure allowed scraping paths (robots.txt is cached for a day).
     - Implements caching to avoid redundant requests for the same content.
     - Uses a clear User-Agent string to identify the scraper.
     - Introduces delays between requests and uses exponential backoff for retries
       to avoid overloading servers.
     """
+    # Cached pages are stored compressed with zstd. Uncompressed cache files written by
+    # earlier versions of the scraper (LEGACY_CACHE_SUFFIX) are still read.
+    CACHE_SUFFIX = '.html.zst'
+    LEGACY_CACHE_SUFFIX = '.html'
+    CACHE_COMPRESSION_LEVEL = 3
+    # Age (in seconds) after which the cached robots.txt of a site is downloaded again.
+    ROBOTS_TXT_TTL = 24 * 60 * 60
+    # Parser backend used by BeautifulSoup. lxml tokenizes HTML in C and is several times
+    # faster than Python's built-in 'html.parser'.
+    HTML_PARSER = 'lxml'
+
     def __init__(self, base_url, cache_dir='scraper_cache'):
         """
         Initializes the UnintrusivePageScraper.
@@ -70,18 +174,31 @@ class UnintrusivePageScraper:
         self.base_url = base_url
         # Sets a descriptive User-Agent to identify the scraper and provide contact information.
         self.user_agent = "MyWebScraper/1.0 (contact: example@email.com)"
+        # Headers sent with every request, built once (requests copies them, it never modifies them).
+        self._default_headers = {'User-Agent': self.user_agent}
+        # Parsed robots.txt rules; loaded (from the cache or the network) at the end of __init__.
         self.robot_parser = urllib.robotparser.RobotFileParser()
-        # Constructs the full URL for robots.txt and attempts to read it.
-        self.robot_parser.set_url(f"{base_url}/robots.txt")
-        try:
-            self.robot_parser.read()  # Download and parse robots.txt
-            logging.info(f"Successfully read robots.txt for {base_url}")
-        except Exception as e:
-            logging.warning(f"Could not read robots.txt for {base_url}: {e}")
         # Initial delay (in seconds) between requests. This helps prevent overwhelming the server.
         self.delay = 1
-        # Maximum number of times to retry a failed HTTP request.
+        # Monotonic timestamp before which no new request may be sent (see `_wait_for_request_slot`).
+        self._next_request_ts = 0.0
+        # Guards `_next_request_ts` when pages are fetched from several threads (see `scrape_many`).
+        self._request_slot_lock = threading.Lock()
+        # Maximum number of attempts for an HTTP request (the first one included).
         self.max_retries = 3
+        # A single HTTP session is reused for all requests: connections to the same host are kept
+        # alive in a pool instead of paying DNS resolution and a TLS handshake for every page.
+        # Connection errors, timeouts and transient server errors are retried by urllib3 inside the
+        # adapter, with exponential backoff (1x, 2x, ... `self.delay`) and honoring Retry-After.
+        # The backoff is counted from the failed attempt only: retries do not take a politeness
+        # delay slot, so with concurrent fetches (`scrape_many`) a retry may be sent right after
+        # another thread's request.
+        self.session = requests.Session()
+        retry = _PoliteRetry(total=self.max_retries - 1, backoff_factor=self.delay,
+                             status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # Name of the directory to store cached files.
         self.cache_dir = cache_dir
         # Determine the parent directory of the 'app' folder (project root)
@@ -95,6 +212,56 @@ class UnintrusivePageScraper:
         # Create the cache directory if it doesn't already exist.
         os.makedirs(self.abs_cache_dir, exist_ok=True)
         logging.info(f"Cache directory set to: {self.abs_cache_dir}")
+        self._load_robots_txt()
+
+    def _load_robots_txt(self):
+        """
+        Loads the site's robots.txt into `self.robot_parser`.
+
+        robots.txt is cached like pages are. The cached copy is used as long as it is younger than
+        `ROBOTS_TXT_TTL`; otherwise robots.txt is downloaded again and the cache refreshed.
+        The download follows the rules of `urllib.robotparser.RobotFileParser.read`: a 401 or 403
+        response disallows the whole site, and any other 4XX response (no robots.txt) allows it.
+        An unreadable cached copy is discarded and robots.txt is downloaded again. If robots.txt
+        cannot be downloaded at all, the parser stays unread and every URL is disallowed.
+        """
+        robots_url = f"{self.base_url}/robots.txt"
+        self.robot_parser.set_url(robots_url)
+
+        cache_path = self._get_cache_path(robots_url)
+        try:
+            if time.time() - os.path.getmtime(cache_path) < self.ROBOTS_TXT_TTL:
+                with self._open_cache_for_read(robots_url) as f:
+                    self.robot_parser.parse(f.read().decode('utf-8').splitlines())
+                return
+        except FileNotFoundError:
+            pass # Not cached yet.
+        except (OSError, ValueError, zstandard.ZstdError) as e:
+            # An unreadable cached copy is treated as a cache miss.
+            logging.error(f"Error reading cached robots.txt {cache_path}, discarding it: {e}")
+            self._discard_cache(robots_url)
+
+        try:
+            response = self.session.get(robots_url, headers=self._default_headers, timeout=(5, 15))
+        except requests.exceptions.RequestException as e:
+            logging.warning(f"Could not read robots.txt for {self.base_url}: {e}")
+            return
+        finally:
+            self._delay_next_request(self.delay + random.uniform(0, 0.5))
+
+        if response.status_code in (401, 403):
+            robots_txt = "User-agent: *\nDisallow: /"
+        elif 400 <= response.status_code < 500:
+            robots_txt = ""
+        elif response.ok:
+            robots_txt = response.text
+        else:
+            logging.warning(f"Could not read robots.txt for {self.base_url}: HTTP status {response.status_code}")
+            return
+
+        self.robot_parser.parse(robots_txt.splitlines())
+        self._write_cache(cache_path, robots_txt.encode('utf-8'))
+        logging.info(f"Successfully read robots.txt for {self.base_url}")
 
 
     def can_fetch(self, url):
@@ -113,6 +280,145 @@ class UnintrusivePageScraper:
             logging.info(f"robots.txt disallows fetching for URL: {url} with User-Agent: {self.user_agent}")
         return allowed
 
+    def _get_cache_path(self, url, suffix=CACHE_SUFFIX):
+        """
+        Builds the path of the cache file for a URL.
+
+        Args:
+            url (str): The absolute URL whose cache file path is needed.
+            suffix (str): The file extension, `CACHE_SUFFIX` (compressed) or `LEGACY_CACHE_SUFFIX`.
+
+        Returns:
+            str: The path of the cache file inside `self.abs_cache_dir`. The filename is a
+                 sanitized version of the URL (common URL characters replaced with '_').
+        """
+        cache_filename = url.replace('/', '_').replace(':', '_').replace('?', '_').replace('=', '_').replace('&', '_') + suffix
+        return os.path.join(self.abs_cache_dir, cache_filename)
+
+    def _open_cache_for_read(self, url):
+        """
+        Opens the cached copy of a page, if there is one.
+
+        Args:
+            url (str): The absolute URL of the page.
+
+        Returns:
+            A binary file-like object yielding the uncompressed HTML of the page, or None if the
+            page is not cached. Compressed cache files are decompressed transparently, and
+            legacy uncompressed cache files are read as they are.
+        """
+        cache_path = self._get_cache_path(url)
+        if os.path.exists(cache_path):
+            logging.info(f"Cache hit: Using cached version for URL: {url} from path: {cache_path}")
+            return zstandard.ZstdDecompressor().stream_reader(open(cache_path, 'rb'), closefd=True)
+
+        legacy_cache_path = self._get_cache_path(url, self.LEGACY_CACHE_SUFFIX)
+        if os.path.exists(legacy_cache_path):
+            logging.info(f"Cache hit: Using cached version for URL: {url} from path: {legacy_cache_path}")
+            return open(legacy_cache_path, 'rb')
+
+        return None
+
+    def _write_cache(self, cache_path, data):
+        """
+        Atomically writes data to a cache file, compressed with zstd.
+
+        The data is first written to a temporary file in the cache directory, which is then
+        renamed over `cache_path` with `os.replace`. A process killed mid-write therefore leaves
+        either the previous cache file or none at all, never a truncated one.
+        No `fsync` is issued; flushing to disk is left to the OS page cache.
+
+        Args:
+            cache_path (str): The final path of the cache file.
+            data (bytes): The uncompressed content to store.
+        """
+        with self._open_cache_for_write(cache_path) as f:
+            f.write(data)
+
+    @contextlib.contextmanager
+    def _open_cache_for_write(self, cache_path):
+        """
+        Context manager yielding a binary file that replaces `cache_path` once the block exits
+        without error. Data written to it is compressed with zstd on the fly.
+        If the block raises, the partially written file is discarded.
+        See `_write_cache` for why the file is written to a temporary path first.
+
+        Args:
+            cache_path (str): The final path of the cache file.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.abs_cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                compressor = zstandard.ZstdCompressor(level=self.CACHE_COMPRESSION_LEVEL)
+                with compressor.stream_writer(f, closefd=False) as writer:
+                    yield writer
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            # Never leave half-written temporary files behind in the cache directory.
+            os.unlink(tmp_path)
+            raise
+
+    def _wait_for_request_slot(self):
+        """
+        Sleeps until the next request is allowed to be sent.
+
+        Instead of sleeping for the full delay before every request, the scraper keeps the earliest
+        time at which the next request may be sent. Time already spent elsewhere (parsing, cache
+        hits, a slow previous response) counts towards the delay, and cache hits never wait.
+
+        The slot is reserved before sleeping: requests made concurrently from other threads are
+        given the following slots, each at least the base delay after the previous one.
+        """
+        with self._request_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_ts)
+            self._next_request_ts = slot + self.delay + random.uniform(0, 0.5)
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _delay_next_request(self, delay):
+        """
+        Makes the next request wait until at least `delay` seconds from now. A later slot that is
+        already reserved is kept.
+        """
+        with self._request_slot_lock:
+            self._next_request_ts = max(self._next_request_ts, time.monotonic() + delay)
+
+    def _fetch(self, url, stream=False):
+        """
+        Performs the HTTP GET request for a URL, with delays and retries.
+
+        Requests are spaced at least `self.delay` seconds apart (plus a small random jitter) to be
+        polite. Failed requests are retried with exponential backoff by the session's adapter (see
+        `__init__`), for up to `self.max_retries` attempts in all.
+
+        Args:
+            url (str): The absolute URL to request.
+            stream (bool): If True, the response body is not downloaded up front and can be
+                           read incrementally from `response.raw`.
+
+        Returns:
+            requests.Response: The successful response, or None if all attempts failed.
+        """
+        try:
+            # Wait until the politeness delay since the previous request has elapsed.
+            self._wait_for_request_slot()
+
+            logging.info(f"Fetching URL: {url}")
+            try:
+                # Timeouts: 5 seconds to connect, 15 seconds between bytes received.
+                response = self.session.get(url, headers=self._default_headers, timeout=(5, 15), stream=stream)
+            finally:
+                # The next request may only be sent once the base delay (with a small jitter)
+                # has elapsed, counted from the end of this one.
+                self._delay_next_request(self.delay + random.uniform(0, 0.5))
+            response.raise_for_status() # Raise HTTPError for bad responses (4XX or 5XX)
+            return response
+
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to fetch {url} after up to {self.max_retries} attempts: {e}")
+            return None
+
     def get_page_content(self, url):
         """
         Fetches the HTML content of a webpage, implementing unintrusive scraping practices.
@@ -120,7 +426,7 @@ class UnintrusivePageScraper:
         Practices include:
         1. robots.txt check: Verifies if scraping the URL is permitted before any request.
         2. Caching: Returns cached content if available to avoid redundant server requests.
-           Cache files are named based on a sanitized version of the URL.
+           Cache files are named based on a sanitized version of the URL and compressed with zstd.
         3. User-Agent: Sends a defined User-Agent header with the HTTP request.
         4. Delays & Retries: Implements delays between requests and retries with exponential backoff
            in case of network issues or server errors to avoid aggressive scraping.
@@ -140,60 +446,240 @@ class UnintrusivePageScraper:
             return None
 
         # 2. Check Cache:
-        # Create a safe filename from the URL for caching (replace common URL characters).
-        cache_filename = url.replace('/', '_').replace(':', '_').replace('?', '_').replace('=', '_').replace('&', '_') + ".html"
-        cache_path = os.path.join(self.abs_cache_dir, cache_filename)
+        try:
+            cache_file = self._open_cache_for_read(url)
+            if cache_file is not None:
+                with cache_file:
+                    return cache_file.read().decode('utf-8')
+        except Exception as e:
+            logging.error(f"Error reading from cache for URL {url}: {e}")
+            # Proceed to fetch from network if cache read fails
 
-        if os.path.exists(cache_path):
-            logging.info(f"Cache hit: Using cached version for URL: {url} from path: {cache_path}")
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                logging.error(f"Error reading from cache file {cache_path}: {e}")
-                # Proceed to fetch from network if cache read fails
+        # 3. & 4. Fetch the page (User-Agent header, delays and retries are handled by _fetch).
+        return self._fetch_and_cache(url)
 
+    def _fetch_and_cache(self, url):
+        """
+        Fetches a page from the network (a cache miss) and saves it to the cache.
+
+        Args:
+            url (str): The absolute URL of the page to fetch.
+
+        Returns:
+            str: The HTML content of the page, or None if it could not be fetched.
+        """
         logging.info(f"Cache miss: Fetching URL from network: {url}")
-        # 3. Prepare headers for the HTTP request.
-        headers = {'User-Agent': self.user_agent}
+        response = self._fetch(url)
+        if response is None:
+            return None
+
+        # Save to cache before returning
+        cache_path = self._get_cache_path(url)
+        self._write_cache(cache_path, response.text.encode('utf-8'))
+        logging.info(f"Successfully fetched and cached: {url} at {cache_path}")
+        return response.text
+
+    def get_parsed_stream(self, url, tag='tr'):
+        """
+        Streams the `<tr>` elements (or other `tag` elements) of a webpage as lxml elements while
+        it is being parsed.
+
+        The same unintrusive practices as `get_page_content` apply (robots.txt, caching,
+        User-Agent, delays and retries). On a cache miss, the response body is parsed
+        incrementally as it arrives from the network and copied into the cache at the same time.
+        Each row is cleared after the consumer has processed it, so memory use does not grow with
+        the size of the table.
+
+        The consumer may stop early; the rest of the body is then still read so that the cached
+        copy is complete. Close the generator (e.g. with `contextlib.closing`) when stopping early.
+
+        If the cached copy turns out to be unreadable (e.g. a truncated or corrupt file), it is
+        deleted and `_CacheReadError` is raised, possibly after some rows were already yielded.
+        Streaming the page again then fetches it from the network.
 
-        # 4. Attempt to fetch the page with retries and delays.
-        for attempt in range(self.max_retries):
+        Args:
+            url (str): The absolute URL of the page to stream.
+            tag (str): The name of the elements to stream.
+
+        Yields:
+            lxml.html.HtmlElement: The `tag` elements of the page, in document order. Nothing is
+                                   yielded if the URL is disallowed by robots.txt or cannot be fetched.
+        """
+        if not self.can_fetch(url):
+            return
+
+        cache_file = self._open_cache_for_read(url)
+        if cache_file is not None:
             try:
-                # Introduce a delay before making the actual request.
-                # This base delay is applied to be polite, even if not a retry.
-                # Add a small jitter to the delay.
-                time.sleep(self.delay + random.uniform(0, 0.5))
-
-                logging.info(f"Fetching URL: {url} (Attempt {attempt + 1}/{self.max_retries})")
-                response = requests.get(url, headers=headers, timeout=10) # Timeout for the request
-                response.raise_for_status() # Raise HTTPError for bad responses (4XX or 5XX)
-
-                # Save to cache before returning
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-                logging.info(f"Successfully fetched and cached: {url} at {cache_path}")
-                return response.text
-
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Error fetching {url} (attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff: delay increases with each retry.
-                    # Also adds a small random jitter.
-                    current_retry_delay = self.delay * (2 ** attempt) + random.uniform(0, 1)
-                    logging.info(f"Retrying in {current_retry_delay:.2f} seconds...")
-                    time.sleep(current_retry_delay)
-                else:
-                    logging.error(f"Failed to fetch {url} after {self.max_retries} retries.")
-                    return None
+                with cache_file:
+                    yield from self._iterparse_rows(cache_file, tag)
+            except (OSError, ValueError, zstandard.ZstdError, etree.LxmlError) as e:
+                logging.error(f"Error reading from cache for URL {url}, discarding it: {e}")
+                self._discard_cache(url)
+                raise _CacheReadError(url) from e
+            return
+
+        logging.info(f"Cache miss: Streaming URL from network: {url}")
+        response = self._fetch(url, stream=True)
+        if response is None:
+            return
+
+        # Decode the body like `response.text` does for fetched pages (charset of the Content-Type).
+        encoding = response.encoding or 'utf-8'
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            logging.warning(f"Unknown charset {encoding!r} for {url}, decoding it as UTF-8")
+            encoding = 'utf-8'
+
+        cache_path = self._get_cache_path(url)
+        with response, self._open_cache_for_write(cache_path) as cache_file:
+            # Let urllib3 undo any Content-Encoding (gzip, deflate) of the raw body.
+            response.raw.decode_content = True
+            reader = _CachingReader(response.raw, cache_file, encoding)
+            try:
+                yield from self._iterparse_rows(reader, tag)
+            except GeneratorExit:
+                # The consumer stopped early; the cached copy must still be complete.
+                pass
+            reader.drain()
+        logging.info(f"Successfully streamed and cached: {url} at {cache_path}")
+
+    def _discard_cache(self, url):
+        """Deletes the cached copies (compressed and legacy) of a page."""
+        for suffix in (self.CACHE_SUFFIX, self.LEGACY_CACHE_SUFFIX):
+            try:
+                os.remove(self._get_cache_path(url, suffix))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _iterparse_rows(source, tag='tr'):
+        """
+        Incrementally parses UTF-8 encoded HTML from a binary file-like object, yielding each `tag`
+        element (`<tr>` by default) once it is complete and clearing it afterwards.
+
+        The encoding is given explicitly: cached and streamed pages are always UTF-8, whatever
+        charset the page itself declares (or lxml would guess).
+        """
+        for _, row in etree.iterparse(source, events=('end',), tag=tag, html=True, encoding='utf-8'):
+            yield row
+            row.clear(keep_tail=True)
+
+    def _get_target_url(self, strategy: PageScrapingStrategy):
+        """
+        Constructs the full URL to scrape for a strategy.
+        Assumes strategy.get_url() returns a relative path.
+        """
+        relative_url = strategy.get_url()
+        if not relative_url.startswith('/'):
+            # Ensure leading slash if strategy URL is just a path segment
+            relative_url = '/' + relative_url
+        return self.base_url + relative_url # Example: "https://en.wikipedia.org" + "/wiki/Some_Page"
+
+    def _is_cached(self, url):
+        """Returns True if a cached copy (compressed or legacy) of the page exists."""
+        return (os.path.exists(self._get_cache_path(url))
+                or os.path.exists(self._get_cache_path(url, self.LEGACY_CACHE_SUFFIX)))
+
+    async def _ahttp_fetch(self, urls):
+        """
+        Fetches several URLs concurrently over a single HTTP/2 connection.
+
+        All requests are multiplexed over one connection, so they share a single TLS handshake
+        and congestion window instead of each opening their own connection. If the server does
+        not negotiate HTTP/2, the requests are sent one after another over that one connection.
+        Redirects are followed, like `requests` does for the regular fetch.
+
+        Args:
+            urls (list[str]): The absolute URLs to fetch.
+
+        Returns:
+            list: For each URL, in order, either the `httpx.Response` or the exception raised
+                  while fetching it.
+        """
+        async with httpx.AsyncClient(http2=True, headers=self._default_headers, timeout=10,
+                                     follow_redirects=True, limits=httpx.Limits(max_connections=1)) as client:
+            return await asyncio.gather(*[client.get(url) for url in urls], return_exceptions=True)
+
+    def _prefetch(self, urls):
+        """
+        Fetches, in a single HTTP/2 batch, the pages among `urls` that are allowed by robots.txt
+        and not cached yet, and stores them in the cache. All the requests of the batch are sent
+        at once, multiplexed over the one connection; the batch as a whole counts as a single
+        request for the politeness delay. Pages that fail to download (or the whole batch, e.g.
+        when called from a running event loop, where `asyncio.run` is not allowed) are logged and
+        left to the regular (retrying) fetch.
+
+        Args:
+            urls (list[str]): The absolute URLs about to be scraped.
+        """
+        pending = [url for url in dict.fromkeys(urls) if self.can_fetch(url) and not self._is_cached(url)]
+        if len(pending) < 2:
+            # Nothing to batch.
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass # No event loop running in this thread: asyncio.run can be used.
+        else:
+            logging.info("Not prefetching over HTTP/2 from within a running event loop")
+            return
+
+        self._wait_for_request_slot()
+        logging.info(f"Fetching {len(pending)} URLs over HTTP/2")
+        try:
+            responses = asyncio.run(self._ahttp_fetch(pending))
+        except Exception as e:
+            logging.error(f"Error fetching URLs over HTTP/2, they will be fetched again on their own: {e}")
+            return
+        finally:
+            self._delay_next_request(self.delay + random.uniform(0, 0.5))
+
+        for url, response in zip(pending, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                response.raise_for_status()
+                self._write_cache(self._get_cache_path(url), response.text.encode('utf-8'))
+                logging.info(f"Successfully fetched and cached: {url}")
+            except Exception as e:
+                logging.error(f"Error fetching {url} over HTTP/2, it will be fetched again on its own: {e}")
+
+    def scrape_many(self, strategies: list[PageScrapingStrategy], max_workers=8) -> list:
+        """
+        Performs the scraping operation for several pages, one per strategy.
+
+        When httpx (with HTTP/2 support) is installed, the pages that are not cached yet are first
+        downloaded together over one multiplexed HTTP/2 connection and cached; these requests are
+        sent at once, as a single batch (see `_prefetch`). The strategies are then scraped with
+        `scrape` from a pool of threads sharing this scraper's session. Pages still missing from
+        the cache (all of them without httpx) are fetched over HTTP/1.1 keep-alive connections,
+        with overlapping downloads; each of these requests waits for its own politeness delay slot
+        (retries excepted, see `__init__`).
+
+        Args:
+            strategies: The PageScrapingStrategy instances to scrape.
+            max_workers (int): The maximum number of pages scraped at the same time.
+
+        Returns:
+            A list with the result of `scrape` for each strategy, in the same order.
+        """
+        if httpx is not None:
+            self._prefetch([self._get_target_url(strategy) for strategy in strategies])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.scrape, strategies))
 
     def scrape(self, strategy: PageScrapingStrategy) -> list[dict]:
         """
         Performs the scraping operation for a single page using a given strategy.
 
         It constructs the full URL using the scraper's base_url and the strategy's get_url() method.
-        Then, it fetches the page content using `get_page_content` (which includes caching and
-        unintrusive measures) and uses the strategy's `parse()` method to extract data.
+        Then, it reads the page from the cache or fetches it (with the same unintrusive measures
+        as `get_page_content`) and uses the strategy's `parse()` method to extract data.
+        Strategies that set `supports_row_stream` instead receive the page's table rows as they
+        are parsed, through their `parse_rows()` method (see `get_parsed_stream`).
 
         Args:
             strategy: An instance of PageScrapingStrategy that defines which URL
@@ -204,24 +690,29 @@ class UnintrusivePageScraper:
             strategy's parse method. Returns an empty list if fetching or parsing fails,
             or if the URL is disallowed by robots.txt.
         """
-        # Construct the full URL to scrape.
-        # Assumes strategy.get_url() returns a relative path.
-        relative_url = strategy.get_url()
-        if not relative_url.startswith('/'):
-            # Ensure leading slash if strategy URL is just a path segment
-            relative_url = '/' + relative_url
-        target_url = self.base_url + relative_url # Example: "https://en.wikipedia.org" + "/wiki/Some_Page"
+        target_url = self._get_target_url(strategy)
 
         logging.info(f"Attempting to scrape URL: {target_url} using strategy: {strategy.__class__.__name__}")
 
-        html_content = self.get_page_content(target_url)
+        if strategy.supports_row_stream:
+            return self._scrape_row_stream(strategy, target_url)
+
+        if not self.can_fetch(target_url):
+            logging.warning(f"Fetching {target_url} is disallowed by robots.txt. Scraping aborted for this URL.")
+            return []
 
-        if not html_content:
-            logging.warning(f"No HTML content received for {target_url}. Scraping aborted for this URL.")
-            return [] # Return empty list if page content couldn't be fetched
+        # Cached pages are parsed straight from the cache file; other pages are fetched first.
+        soup = self._parse_cached_page(target_url, strategy.parse_only)
+        if soup is None:
+            html_content = self._fetch_and_cache(target_url)
+
+            if not html_content:
+                logging.warning(f"No HTML content received for {target_url}. Scraping aborted for this URL.")
+                return [] # Return empty list if page content couldn't be fetched
 
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if soup is None:
+                soup = BeautifulSoup(html_content, self.HTML_PARSER, parse_only=strategy.parse_only)
             # Delegate parsing to the provided strategy.
             data = strategy.parse(soup)
             logging.info(f"Successfully parsed data from {target_url} using {strategy.__class__.__name__}.")
@@ -229,3 +720,57 @@ class UnintrusivePageScraper:
         except Exception as e:
             logging.error(f"Error parsing content from {target_url} with strategy {strategy.__class__.__name__}: {e}")
             return [] # Return empty list in case of parsing error
+
+    def _parse_cached_page(self, url, parse_only=None):
+        """
+        Parses the cached copy of a page.
+
+        The cache file, opened with `_open_cache_for_read`, is handed to BeautifulSoup as a binary
+        file and its content is parsed as UTF-8.
+
+        Args:
+            url (str): The absolute URL of the page.
+            parse_only (bs4.SoupStrainer): If given, only the matching parts of the page are parsed.
+
+        Returns:
+            BeautifulSoup: The parsed page, or None if the page is not cached or the cache file
+                           cannot be read (the page is then fetched from the network instead).
+        """
+        try:
+            cache_file = self._open_cache_for_read(url)
+            if cache_file is None:
+                return None
+            with cache_file:
+                # Cache files are always UTF-8, whatever encoding the page itself declares.
+                return BeautifulSoup(cache_file, self.HTML_PARSER, from_encoding='utf-8', parse_only=parse_only)
+        except (OSError, ValueError, zstandard.ZstdError) as e:
+            logging.error(f"Error reading from cache for URL {url}: {e}")
+            return None
+
+    def _scrape_row_stream(self, strategy: PageScrapingStrategy, target_url) -> list[dict]:
+        """
+        Scrapes a page for a strategy that supports row streaming (see `PageScrapingStrategy.parse_rows`).
+
+        If the cached copy of the page cannot be read, it is discarded and the page is streamed
+        again from the network; the strategy then parses it from the start.
+
+        Returns:
+            The data returned by the strategy's `parse_rows` method, or an empty list if
+            fetching or parsing fails.
+        """
+        try:
+            try:
+                data = self._parse_row_stream(strategy, target_url)
+            except _CacheReadError:
+                data = self._parse_row_stream(strategy, target_url)
+            logging.info(f"Successfully parsed streamed rows from {target_url} using {strategy.__class__.__name__}.")
+            return data
+        except Exception as e:
+            logging.error(f"Error parsing streamed content from {target_url} with strategy {strategy.__class__.__name__}: {e}")
+            return [] # Return empty list in case of fetching or parsing error
+
+    def _parse_row_stream(self, strategy: PageScrapingStrategy, target_url):
+        """Streams the page's rows to the strategy's `parse_rows` method and returns its result."""
+        with contextlib.closing(self.get_parsed_stream(target_url, strategy.stream_tag)) as rows:
+            # Delegate parsing to the provided strategy.
+            return strategy.parse_rows(rows)
@@ -0,0 +1,35 @@
+import pytest
+
+from app.scrapers.scrape_strategies.example_strategy import ExampleComStrategy
+from app.scrapers.scrape_strategies.waters_strategy import WatersStrategy
+
+
+def pytest_addoption(parser):
+  parser.addoption("--run-network", action="store_true", default=False,
+                   help="run the tests marked with 'network', which make real HTTP requests")
+
+
+def pytest_configure(config):
+  config.addinivalue_line("markers", "network: test makes real HTTP requests (skipped unless --run-network is given)")
+  # Registered here too so that the mark is known when pytest-xdist is not installed.
+  config.addinivalue_line("markers", "xdist_group(name): run the tests of a group on the same pytest-xdist worker")
+
+
+def pytest_collection_modifyitems(config, items):
+  if config.getoption("--run-network"):
+    return
+  skip_network = pytest.mark.skip(reason="needs --run-network")
+  for item in items:
+    if "network" in item.keywords:
+      item.add_marker(skip_network)
+
+
+# Strategies keep no state between parses, so one instance of each serves the whole test session.
+@pytest.fixture(scope="session")
+def example_strategy():
+  return ExampleComStrategy()
+
+
+@pytest.fixture(scope="session")
+def waters_strategy():
+  return WatersStrategy()
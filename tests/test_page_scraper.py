@@ -0,0 +1,548 @@
+import asyncio
+import http.server
+import io
+import os
+import threading
+import time
+import urllib.robotparser
+from unittest import mock
+
+import pytest
+import requests
+import zstandard
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.unintrusive_scraper import page_scraper
+from app.unintrusive_scraper.page_scraper import PageScrapingStrategy, UnintrusivePageScraper
+
+BASE_URL = "https://example.com"
+SAMPLE_HTML_CONTENT = "<html><head><title>Test Page</title></head><body><h1>Hello Café</h1></body></html>"
+# Parsed once; tests compare the soup handed to strategies against it instead of re-parsing.
+SAMPLE_SOUP = BeautifulSoup(SAMPLE_HTML_CONTENT, UnintrusivePageScraper.HTML_PARSER)
+SAMPLE_TABLE_HTML = "<html><body><table><tr><td>1</td></tr><tr><td>2</td></tr><tr><td>3</td></tr></table></body></html>"
+
+
+@pytest.fixture(scope="module")
+def scraper(tmp_path_factory):
+  # Built once per module; the state tests may change is reset before each test by reset_scraper.
+  # Skip loading robots.txt so that no network request is made in __init__.
+  with mock.patch.object(UnintrusivePageScraper, '_load_robots_txt'):
+    return UnintrusivePageScraper(BASE_URL, cache_dir=str(tmp_path_factory.mktemp("scraper_cache")))
+
+
+@pytest.fixture(autouse=True)
+def reset_scraper(scraper, tmp_path):
+  scraper.robot_parser = mock.Mock()
+  scraper.robot_parser.can_fetch.return_value = True
+  # Every test gets an empty cache directory of its own.
+  scraper.cache_dir = scraper.abs_cache_dir = str(tmp_path)
+  scraper._next_request_ts = 0.0
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+  # Politeness delays are irrelevant for unit tests.
+  with mock.patch('time.sleep') as mock_sleep:
+    yield mock_sleep
+
+
+@pytest.fixture
+def mock_strategy():
+  # spec_set also rejects setting attributes the strategy interface does not have. Each test
+  # builds its own mock: copies of a shared template would share its child mocks (and calls).
+  strategy = mock.Mock(spec_set=PageScrapingStrategy)
+  strategy.supports_row_stream = False
+  strategy.parse_only = None
+  strategy.get_url.return_value = "/test_path"
+  strategy.parse.return_value = {"key": "parsed_value"}
+  return strategy
+
+
+@pytest.fixture
+def mock_session_get(scraper):
+  with mock.patch.object(scraper.session, 'get') as mock_session_get:
+    yield mock_session_get
+
+
+def read_cache_file(path):
+  with open(path, 'rb') as f:
+    return zstandard.ZstdDecompressor().stream_reader(f).read().decode('utf-8')
+
+
+def make_response(text, status_code=200, encoding='utf-8'):
+  response = mock.MagicMock(spec=requests.Response)
+  response.status_code = status_code
+  response.ok = status_code < 400
+  response.encoding = encoding
+  response.text = text
+  response.raw = io.BytesIO(text.encode(encoding))
+  response.raise_for_status.return_value = None
+  return response
+
+
+# Stands for a robots.txt that could not be read in __init__.
+ROBOTS_READ_FAILED = object()
+ROBOTS_TXT_LINES = [
+  "User-agent: *",
+  "Allow: /private/public",
+  "Disallow: /private",
+]
+
+
+class TestUnintrusivePageScraperCanFetch:
+
+  @pytest.mark.parametrize("url,robots_txt_lines,expected", [
+    (BASE_URL + "/page", ROBOTS_TXT_LINES, True),
+    (BASE_URL + "/private", ROBOTS_TXT_LINES, False),
+    (BASE_URL + "/private/page", ROBOTS_TXT_LINES, False),
+    (BASE_URL + "/private/public/page", ROBOTS_TXT_LINES, True),
+    (BASE_URL + "/page", ["User-agent: *", "Disallow: /"], False),
+    (BASE_URL + "/page", ROBOTS_READ_FAILED, False),
+  ])
+  def test_can_fetch(self, scraper, url, robots_txt_lines, expected):
+    scraper.robot_parser = urllib.robotparser.RobotFileParser(BASE_URL + "/robots.txt")
+    # A parser that never got to read robots.txt disallows everything.
+    if robots_txt_lines is not ROBOTS_READ_FAILED:
+      scraper.robot_parser.parse(robots_txt_lines)
+
+    assert scraper.can_fetch(url) is expected
+
+
+def build_scraper(cache_dir, **session_get_kwargs):
+  """Builds a scraper that loads robots.txt through a mocked session.get."""
+  with mock.patch('requests.Session.get', **session_get_kwargs) as mock_get:
+    scraper = UnintrusivePageScraper(BASE_URL, cache_dir=str(cache_dir))
+  return scraper, mock_get
+
+
+class TestUnintrusivePageScraperRobotsTxt:
+
+  def test_robots_txt_is_fetched_and_cached(self, tmp_path):
+    robots_txt = "User-agent: *\nDisallow: /private"
+    scraper, mock_get = build_scraper(tmp_path, return_value=make_response(robots_txt))
+
+    mock_get.assert_called_once_with(BASE_URL + "/robots.txt", headers={'User-Agent': scraper.user_agent}, timeout=(5, 15))
+    assert scraper.can_fetch(BASE_URL + "/page")
+    assert not scraper.can_fetch(BASE_URL + "/private/page")
+    assert read_cache_file(scraper._get_cache_path(BASE_URL + "/robots.txt")) == robots_txt
+
+  def test_cached_robots_txt_is_used_within_ttl(self, tmp_path):
+    build_scraper(tmp_path, return_value=make_response("User-agent: *\nDisallow: /private"))
+    scraper, mock_get = build_scraper(tmp_path)
+
+    mock_get.assert_not_called()
+    assert not scraper.can_fetch(BASE_URL + "/private/page")
+
+  def test_expired_robots_txt_is_fetched_again(self, tmp_path):
+    scraper, _ = build_scraper(tmp_path, return_value=make_response("User-agent: *\nDisallow: /private"))
+    expired = time.time() - scraper.ROBOTS_TXT_TTL - 1
+    os.utime(scraper._get_cache_path(BASE_URL + "/robots.txt"), (expired, expired))
+
+    scraper, mock_get = build_scraper(tmp_path, return_value=make_response(""))
+
+    mock_get.assert_called_once()
+    assert scraper.can_fetch(BASE_URL + "/private/page")
+
+  @pytest.mark.parametrize("content", [b"not zstd data", zstandard.ZstdCompressor().compress(b"\xff\xfe")])
+  def test_unreadable_cached_robots_txt_is_fetched_again(self, tmp_path, content):
+    scraper, _ = build_scraper(tmp_path, return_value=make_response(""))
+    cache_path = scraper._get_cache_path(BASE_URL + "/robots.txt")
+    with open(cache_path, 'wb') as f:
+      f.write(content)
+
+    scraper, mock_get = build_scraper(tmp_path, return_value=make_response("User-agent: *\nDisallow: /private"))
+
+    mock_get.assert_called_once()
+    assert not scraper.can_fetch(BASE_URL + "/private/page")
+    assert read_cache_file(cache_path) == "User-agent: *\nDisallow: /private"
+
+  @pytest.mark.parametrize("status_code,allowed", [(403, False), (404, True)])
+  def test_robots_txt_error_status(self, tmp_path, status_code, allowed):
+    scraper, _ = build_scraper(tmp_path, return_value=make_response("", status_code=status_code))
+
+    assert scraper.can_fetch(BASE_URL + "/page") is allowed
+
+  @pytest.mark.parametrize("session_get_kwargs", [
+    {"return_value": make_response("", status_code=503)},
+    {"side_effect": requests.exceptions.ConnectionError("unreachable")},
+  ])
+  def test_unreadable_robots_txt_disallows_everything_and_is_not_cached(self, tmp_path, session_get_kwargs):
+    scraper, _ = build_scraper(tmp_path, **session_get_kwargs)
+
+    assert not scraper.can_fetch(BASE_URL + "/page")
+    assert not os.path.exists(scraper._get_cache_path(BASE_URL + "/robots.txt"))
+
+
+class TestUnintrusivePageScraperCache:
+
+  def test_cache_path_is_sanitized_url(self, scraper):
+    cache_path = scraper._get_cache_path(BASE_URL + "/search?q=lake&page=2")
+
+    assert cache_path == os.path.join(scraper.abs_cache_dir, "https___example.com_search_q_lake_page_2.html.zst")
+
+  def test_fetched_page_is_written_to_cache(self, mock_session_get, scraper):
+    url = BASE_URL + "/page"
+    mock_session_get.return_value = make_response(SAMPLE_HTML_CONTENT)
+
+    assert scraper.get_page_content(url) == SAMPLE_HTML_CONTENT
+
+    mock_session_get.assert_called_once_with(url, headers=scraper._default_headers, timeout=(5, 15), stream=False)
+    assert scraper._default_headers == {'User-Agent': scraper.user_agent}
+    assert read_cache_file(scraper._get_cache_path(url)) == SAMPLE_HTML_CONTENT
+    # Only the final cache file remains, no temporary files.
+    assert os.listdir(scraper.abs_cache_dir) == [os.path.basename(scraper._get_cache_path(url))]
+
+  def test_cached_page_is_served_without_request(self, mock_session_get, scraper):
+    url = BASE_URL + "/page"
+    mock_session_get.return_value = make_response(SAMPLE_HTML_CONTENT)
+
+    scraper.get_page_content(url)
+    assert scraper.get_page_content(url) == SAMPLE_HTML_CONTENT
+    mock_session_get.assert_called_once()
+
+  def test_legacy_uncompressed_cache_is_read(self, mock_session_get, scraper):
+    url = BASE_URL + "/page"
+    with open(scraper._get_cache_path(url, scraper.LEGACY_CACHE_SUFFIX), 'w', encoding='utf-8') as f:
+      f.write(SAMPLE_HTML_CONTENT)
+
+    assert scraper.get_page_content(url) == SAMPLE_HTML_CONTENT
+    mock_session_get.assert_not_called()
+
+  def test_failed_cache_write_keeps_previous_file(self, scraper):
+    cache_path = scraper._get_cache_path(BASE_URL + "/page")
+    scraper._write_cache(cache_path, b"previous")
+
+    with mock.patch('os.replace', side_effect=OSError("disk full")):
+      with pytest.raises(OSError):
+        scraper._write_cache(cache_path, b"new")
+
+    assert read_cache_file(cache_path) == "previous"
+    assert os.listdir(scraper.abs_cache_dir) == [os.path.basename(cache_path)]
+
+
+class TestUnintrusivePageScraperDelay:
+
+  def test_first_request_is_not_delayed(self, mock_session_get, scraper, no_sleep):
+    mock_session_get.return_value = make_response(SAMPLE_HTML_CONTENT)
+
+    scraper.get_page_content(BASE_URL + "/page")
+
+    no_sleep.assert_not_called()
+    assert scraper._next_request_ts >= time.monotonic() + scraper.delay - 0.1
+
+  def test_request_waits_only_for_remaining_delay(self, mock_session_get, scraper, no_sleep):
+    mock_session_get.return_value = make_response(SAMPLE_HTML_CONTENT)
+    scraper._next_request_ts = time.monotonic() + 0.5
+
+    scraper.get_page_content(BASE_URL + "/page")
+
+    no_sleep.assert_called_once()
+    assert 0 < no_sleep.call_args.args[0] <= 0.5
+
+  def test_cache_hit_is_not_delayed(self, mock_session_get, scraper, no_sleep):
+    url = BASE_URL + "/page"
+    scraper._write_cache(scraper._get_cache_path(url), SAMPLE_HTML_CONTENT.encode('utf-8'))
+    scraper._next_request_ts = time.monotonic() + 60
+
+    assert scraper.get_page_content(url) == SAMPLE_HTML_CONTENT
+    no_sleep.assert_not_called()
+
+
+class FlakyHandler(http.server.BaseHTTPRequestHandler):
+  # Statuses returned by the next requests, in order; 200 (with SAMPLE_HTML_CONTENT) once exhausted.
+  # "/moved" always redirects to "/page".
+  statuses = []
+
+  def do_GET(self):
+    if self.path == "/moved":
+      self.send_response(301)
+      self.send_header("Location", "/page")
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+    status = self.statuses.pop(0) if self.statuses else 200
+    body = SAMPLE_HTML_CONTENT.encode('utf-8') if status == 200 else b""
+    self.send_response(status)
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format, *args):
+    pass
+
+
+@pytest.fixture
+def flaky_server():
+  server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+  thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+  thread.start()
+  yield f"http://127.0.0.1:{server.server_port}"
+  server.shutdown()
+  server.server_close()
+  FlakyHandler.statuses = []
+
+
+class TestUnintrusivePageScraperRetry:
+
+  def test_failed_request_is_not_retried_by_scraper(self, mock_session_get, scraper):
+    # Retries happen inside the session's adapter; the scraper itself makes a single call.
+    mock_session_get.side_effect = requests.exceptions.ConnectionError("unreachable")
+
+    assert scraper.get_page_content(BASE_URL + "/page") is None
+    assert mock_session_get.call_count == 1
+
+  def test_server_errors_are_retried_with_backoff(self, scraper, flaky_server, no_sleep):
+    FlakyHandler.statuses = [503, 500]
+
+    assert scraper.get_page_content(flaky_server + "/page") == SAMPLE_HTML_CONTENT
+    # Backoff sleeps of the two retries: 1x then 2x the base delay.
+    assert [call.args[0] for call in no_sleep.call_args_list] == [scraper.delay, 2 * scraper.delay]
+
+  def test_request_fails_once_retries_are_exhausted(self, scraper, flaky_server):
+    # One more 503 than there are attempts: it must never be requested.
+    FlakyHandler.statuses = [503] * (scraper.max_retries + 1)
+
+    assert scraper.get_page_content(flaky_server + "/page") is None
+    assert FlakyHandler.statuses == [503]
+
+
+class FirstRowStrategy(PageScrapingStrategy):
+  supports_row_stream = True
+
+  def get_url(self):
+    return "/table"
+
+  def parse(self, soup):
+    raise AssertionError("parse must not be called for row-streaming strategies")
+
+  def parse_rows(self, rows):
+    # Stops after the first row.
+    return [{"cell": next(rows).findtext('td')}]
+
+
+class ListItemStrategy(PageScrapingStrategy):
+  supports_row_stream = True
+  stream_tag = 'li'
+
+  def get_url(self):
+    return "/list"
+
+  def parse(self, soup):
+    raise AssertionError("parse must not be called for row-streaming strategies")
+
+  def parse_rows(self, items):
+    return [item.text for item in items]
+
+
+class TestUnintrusivePageScraperRowStream:
+
+  def test_stream_is_cached_even_when_consumer_stops_early(self, mock_session_get, scraper):
+    mock_session_get.return_value = make_response(SAMPLE_TABLE_HTML)
+
+    assert scraper.scrape(FirstRowStrategy()) == [{"cell": "1"}]
+
+    assert mock_session_get.call_args.kwargs['stream'] is True
+    assert read_cache_file(scraper._get_cache_path(BASE_URL + "/table")) == SAMPLE_TABLE_HTML
+
+  def test_stream_uses_cache(self, mock_session_get, scraper):
+    url = BASE_URL + "/table"
+    scraper._write_cache(scraper._get_cache_path(url), SAMPLE_TABLE_HTML.encode('utf-8'))
+
+    rows = [row.findtext('td') for row in scraper.get_parsed_stream(url)]
+
+    assert rows == ["1", "2", "3"]
+    mock_session_get.assert_not_called()
+
+  def test_stream_decodes_cached_page_as_utf8(self, mock_session_get, scraper):
+    url = BASE_URL + "/table"
+    # The cache is UTF-8 even when the page declares another charset.
+    html = '<html><head><meta charset="iso-8859-1"></head><body><table><tr><td>Café</td></tr></table></body></html>'
+    scraper._write_cache(scraper._get_cache_path(url), html.encode('utf-8'))
+
+    assert [row.findtext('td') for row in scraper.get_parsed_stream(url)] == ["Café"]
+
+  def test_stream_decodes_response_charset_and_caches_utf8(self, mock_session_get, scraper):
+    url = BASE_URL + "/table"
+    html = '<html><head><meta charset="iso-8859-1"></head><body><table><tr><td>Café</td></tr></table></body></html>'
+    mock_session_get.return_value = make_response(html, encoding='ISO-8859-1')
+
+    assert [row.findtext('td') for row in scraper.get_parsed_stream(url)] == ["Café"]
+    assert read_cache_file(scraper._get_cache_path(url)) == html
+
+  def test_caching_reader_does_not_end_inside_a_character(self):
+    cache_file = io.BytesIO()
+    reader = page_scraper._CachingReader(io.BytesIO("Café".encode('utf-8')), cache_file, 'utf-8')
+
+    chunks = list(iter(lambda: reader.read(1), b""))
+
+    assert b"".join(chunks) == cache_file.getvalue() == "Café".encode('utf-8')
+
+  def test_stream_tag_selects_streamed_elements(self, mock_session_get, scraper):
+    mock_session_get.return_value = make_response("<html><body><ul><li>a</li><li>b</li></ul>" + SAMPLE_TABLE_HTML + "</body></html>")
+
+    assert scraper.scrape(ListItemStrategy()) == ["a", "b"]
+
+  @pytest.mark.parametrize("content", [
+    b"not zstd data",
+    # A compressed file cut off before its end.
+    zstandard.ZstdCompressor().compress(SAMPLE_TABLE_HTML.encode('utf-8'))[:-8],
+  ])
+  def test_unreadable_cache_is_discarded_and_streamed_from_network(self, mock_session_get, scraper, content):
+    with open(scraper._get_cache_path(BASE_URL + "/table"), 'wb') as f:
+      f.write(content)
+    mock_session_get.return_value = make_response(SAMPLE_TABLE_HTML)
+
+    assert scraper.scrape(FirstRowStrategy()) == [{"cell": "1"}]
+
+    mock_session_get.assert_called_once()
+    assert read_cache_file(scraper._get_cache_path(BASE_URL + "/table")) == SAMPLE_TABLE_HTML
+
+  def test_stream_disallowed_by_robots(self, mock_session_get, scraper):
+    scraper.robot_parser.can_fetch.return_value = False
+
+    assert scraper.scrape(FirstRowStrategy()) == []
+    mock_session_get.assert_not_called()
+
+
+class TitleStrategy(PageScrapingStrategy):
+
+  def __init__(self, path):
+    self.path = path
+
+  def get_url(self):
+    return self.path
+
+  def parse(self, soup):
+    return {"title": soup.title.string}
+
+
+class HeadingOnlyStrategy(TitleStrategy):
+  parse_only = SoupStrainer("h1")
+
+  def parse(self, soup):
+    return {"title": soup.title, "heading": soup.h1.string}
+
+
+class TestUnintrusivePageScraperScrape:
+
+  @pytest.mark.parametrize("cached", [False, True])
+  def test_scrape_success(self, mock_session_get, scraper, mock_strategy, cached):
+    url = BASE_URL + "/test_path"
+    if cached:
+      scraper._write_cache(scraper._get_cache_path(url), SAMPLE_HTML_CONTENT.encode('utf-8'))
+    mock_session_get.return_value = make_response(SAMPLE_HTML_CONTENT)
+
+    assert scraper.scrape(mock_strategy) == {"key": "parsed_value"}
+
+    soup = mock_strategy.parse.call_args[0][0]
+    assert isinstance(soup, BeautifulSoup)
+    assert soup == SAMPLE_SOUP
+    assert mock_session_get.call_count == (0 if cached else 1)
+
+  @pytest.mark.parametrize("cached", [False, True])
+  def test_scrape_parses_only_what_strategy_asks_for(self, mock_session_get, scraper, cached):
+    url = BASE_URL + "/page"
+    if cached:
+      scraper._write_cache(scraper._get_cache_path(url), SAMPLE_HTML_CONTENT.encode('utf-8'))
+    mock_session_get.return_value = make_response(SAMPLE_HTML_CONTENT)
+
+    # The <title> is left out of the soup; only the <h1> was parsed.
+    assert scraper.scrape(HeadingOnlyStrategy("/page")) == {"title": None, "heading": "Hello Café"}
+
+
+class TestUnintrusivePageScraperScrapeCached:
+
+  @pytest.mark.parametrize("suffix", [UnintrusivePageScraper.CACHE_SUFFIX, UnintrusivePageScraper.LEGACY_CACHE_SUFFIX])
+  def test_cached_page_is_parsed_from_cache_file(self, mock_session_get, scraper, suffix):
+    url = BASE_URL + "/page"
+    # The cache is UTF-8 even when the page declares another charset.
+    html = '<html><head><meta charset="iso-8859-1"><title>Café</title></head></html>'
+    if suffix == scraper.CACHE_SUFFIX:
+      scraper._write_cache(scraper._get_cache_path(url), html.encode('utf-8'))
+    else:
+      with open(scraper._get_cache_path(url, suffix), 'wb') as f:
+        f.write(html.encode('utf-8'))
+
+    assert scraper.scrape(TitleStrategy("/page")) == {"title": "Café"}
+    mock_session_get.assert_not_called()
+
+  def test_unreadable_cache_file_falls_back_to_network(self, mock_session_get, scraper):
+    url = BASE_URL + "/page"
+    with open(scraper._get_cache_path(url), 'wb') as f:
+      f.write(b"not zstd data")
+    mock_session_get.return_value = make_response("<title>Fetched</title>")
+
+    assert scraper.scrape(TitleStrategy("/page")) == {"title": "Fetched"}
+
+
+class TestUnintrusivePageScraperScrapeMany:
+
+  @pytest.mark.skipif(page_scraper.httpx is None, reason="httpx[http2] is not installed")
+  def test_pages_are_prefetched_in_one_batch(self, mock_session_get, scraper):
+    pages = {BASE_URL + "/a": "<title>A</title>", BASE_URL + "/b": "<title>B</title>"}
+    fetched = []
+
+    async def fake_ahttp_fetch(urls):
+      fetched.append(urls)
+      return [make_response(pages[url]) for url in urls]
+
+    with mock.patch.object(scraper, '_ahttp_fetch', side_effect=fake_ahttp_fetch):
+      results = scraper.scrape_many([TitleStrategy("/a"), TitleStrategy("b")])
+
+    assert results == [{"title": "A"}, {"title": "B"}]
+    assert fetched == [[BASE_URL + "/a", BASE_URL + "/b"]]
+    mock_session_get.assert_not_called()
+
+  @pytest.mark.skipif(page_scraper.httpx is None, reason="httpx[http2] is not installed")
+  def test_failed_prefetch_falls_back_to_regular_fetch(self, mock_session_get, scraper):
+    mock_session_get.return_value = make_response("<title>B</title>")
+
+    async def fake_ahttp_fetch(urls):
+      return [make_response("<title>A</title>"), page_scraper.httpx.ConnectError("refused")]
+
+    with mock.patch.object(scraper, '_ahttp_fetch', side_effect=fake_ahttp_fetch):
+      results = scraper.scrape_many([TitleStrategy("/a"), TitleStrategy("/b")])
+
+    assert results == [{"title": "A"}, {"title": "B"}]
+    assert mock_session_get.call_args.args == (BASE_URL + "/b",)
+
+  @pytest.mark.parametrize("max_workers", [1, 8])
+  def test_without_httpx_results_keep_strategy_order(self, mock_session_get, scraper, max_workers):
+    mock_session_get.side_effect = lambda url, **kwargs: make_response(f"<title>{url}</title>")
+    paths = [f"/page{i}" for i in range(10)]
+
+    with mock.patch.object(page_scraper, 'httpx', None):
+      results = scraper.scrape_many([TitleStrategy(path) for path in paths], max_workers=max_workers)
+
+    assert results == [{"title": BASE_URL + path} for path in paths]
+    assert mock_session_get.call_count == 10
+
+  def test_concurrent_fetches_keep_politeness_delay(self, mock_session_get, scraper, no_sleep):
+    mock_session_get.side_effect = lambda url, **kwargs: make_response("<title>Page</title>")
+
+    with mock.patch.object(page_scraper, 'httpx', None):
+      scraper.scrape_many([TitleStrategy(f"/page{i}") for i in range(5)], max_workers=5)
+
+    # Every request after the first got its own slot, each at least the base delay after the previous one.
+    waits = sorted(call.args[0] for call in no_sleep.call_args_list)
+    assert len(waits) == 4
+    assert all(wait >= (i + 1) * scraper.delay - 0.1 for i, wait in enumerate(waits))
+
+  @pytest.mark.skipif(page_scraper.httpx is None, reason="httpx[http2] is not installed")
+  def test_prefetch_follows_redirects(self, scraper, flaky_server):
+    scraper._prefetch([flaky_server + "/moved", flaky_server + "/other"])
+
+    assert read_cache_file(scraper._get_cache_path(flaky_server + "/moved")) == SAMPLE_HTML_CONTENT
+
+  @pytest.mark.skipif(page_scraper.httpx is None, reason="httpx[http2] is not installed")
+  def test_prefetch_is_skipped_inside_running_event_loop(self, mock_session_get, scraper):
+    mock_session_get.side_effect = lambda url, **kwargs: make_response(f"<title>{url}</title>")
+
+    async def scrape_from_coroutine():
+      return scraper.scrape_many([TitleStrategy("/a"), TitleStrategy("/b")])
+
+    with mock.patch.object(scraper, '_ahttp_fetch') as mock_ahttp_fetch:
+      results = asyncio.run(scrape_from_coroutine())
+
+    mock_ahttp_fetch.assert_not_called()
+    assert results == [{"title": BASE_URL + "/a"}, {"title": BASE_URL + "/b"}]
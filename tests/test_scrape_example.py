@@ -1,27 +1,14 @@
-import unittest
-import tempfile
-import shutil
+import pytest
 from app.unintrusive_scraper.page_scraper import UnintrusivePageScraper
-from app.scrapers.scrape_strategies.example_strategy import ExampleComStrategy
 
-class TestScrapeExample(unittest.TestCase):
-    
-  def setUp(self):
-    self.temp_dir = tempfile.mkdtemp()
 
-  def tearDown(self):
-    shutil.rmtree(self.temp_dir)
+@pytest.mark.network
+def test_scrape_example_dot_com(tmp_path, example_strategy):
+  # Each test gets its own cache directory, so live tests can run in parallel (pytest -n auto).
+  scraper = UnintrusivePageScraper("https://example.com", cache_dir=str(tmp_path))
 
-  def test_scrape_example_dot_com(self):
-    url = "https://example.com"
-    scraper = UnintrusivePageScraper(url, cache_dir=self.temp_dir)
-    strategy = ExampleComStrategy()
+  result = scraper.scrape(example_strategy)
 
-    result = scraper.scrape(strategy)
-
-    # Assert the expected values
-    self.assertEqual(result["title"], "Example Domain")
-    self.assertEqual(result["heading"], "Example Domain")
-
-if __name__ == '__main__':
-    unittest.main()
+  # Assert the expected values
+  assert result["title"] == "Example Domain"
+  assert result["heading"] == "Example Domain"
@@ -0,0 +1,50 @@
+import json
+from unittest import mock
+
+from app.scrapers import scrape_waters
+from app.scrapers.scrape_strategies.waters_strategy import Water
+from app.scrapers.scrape_waters import process, transform_and_filter_water_data
+
+MOCK_RAW_WATERS_DATA = [
+  Water(name="Lake A", type_1="Lake", type_2="", parent="River B",
+        start_county="York County", end_county="York County"),
+  Water(name="River B", type_1=" river ", type_2="Main", parent="Bay of Fundy",
+        start_county="Carleton County", end_county="Saint John County"),
+  Water(name="Bay C", type_1="Bay", type_2="", parent="",
+        start_county="Charlotte County", end_county="Charlotte County"),
+  Water(name="Lake D", type_1="Lake", type_2="", parent="",
+        start_county="Unknown County", end_county="Unknown County"),
+]
+
+EXPECTED_PROCESSED_WATERS_ROWS = [
+  ["Lake A", "lakes, ponds and reservoirs", "Lower Saint John"],
+  ["River B", "rivers, brooks and streams", "Lower Saint John"],
+  ["River B", "rivers, brooks and streams", "Upper Saint John"],
+  ["River B", "rivers, brooks and streams", "Inner Bay of Fundy"],
+]
+
+
+def test_process():
+  actual_rows = process(MOCK_RAW_WATERS_DATA)
+
+  # Rows of a water body spanning several regions come in no particular order; rows are unique.
+  assert len(actual_rows) == len(EXPECTED_PROCESSED_WATERS_ROWS)
+  assert frozenset(map(tuple, actual_rows)) == frozenset(map(tuple, EXPECTED_PROCESSED_WATERS_ROWS))
+
+
+def test_transform_and_filter_water_data_with_other_regions():
+  actual_rows = transform_and_filter_water_data(MOCK_RAW_WATERS_DATA, {"York": ["Capital"]})
+
+  assert actual_rows == [["Lake A", "lakes, ponds and reservoirs", "Capital"]]
+
+
+def test_main_prints_rows_as_json(monkeypatch, capsys):
+  # End-to-end smoke test of the script, with the scraper replaced by a fake.
+  fake_scraper = mock.Mock()
+  fake_scraper.scrape.return_value = MOCK_RAW_WATERS_DATA
+  monkeypatch.setattr(scrape_waters, "_scraper_factory", lambda *args, **kwargs: fake_scraper)
+
+  scrape_waters.main()
+
+  actual_rows = json.loads(capsys.readouterr().out)
+  assert frozenset(map(tuple, actual_rows)) == frozenset(map(tuple, EXPECTED_PROCESSED_WATERS_ROWS))
@@ -0,0 +1,135 @@
+import functools
+import io
+from operator import itemgetter
+
+import lxml.html
+import pytest
+from bs4 import BeautifulSoup
+
+from app.scrapers.scrape_strategies.waters_strategy import Water
+from app.unintrusive_scraper.page_scraper import UnintrusivePageScraper
+
+# Strategies are tested with the BeautifulSoup backend the scraper hands them ('lxml').
+PARSER = UnintrusivePageScraper.HTML_PARSER
+
+
+@functools.lru_cache(maxsize=64)
+def _soup(html, parser=PARSER, parse_only=None):
+  # Strategies only read the tree they are given, so one parsed soup per HTML document can be
+  # shared by every test. A test that modifies a soup must parse its own.
+  return BeautifulSoup(html, parser, parse_only=parse_only)
+
+
+# The fields of ExampleComStrategy's result, as a (title, heading) tuple.
+EXAMPLE_FIELDS = itemgetter("title", "heading")
+
+EXAMPLE_CASES = [
+  pytest.param("<html><head><title> Example Domain </title></head><body><h1>Example Domain</h1></body></html>",
+               ("Example Domain", "Example Domain"), id="full"),
+  pytest.param("<html><body><h1>Example Domain</h1></body></html>",
+               ("No title found", "Example Domain"), id="no_title"),
+  pytest.param("<html><head><title>Example Domain</title></head><body><p>Text</p></body></html>",
+               ("Example Domain", "No heading found"), id="no_heading"),
+]
+
+WATERS_HTML = """
+<html><body>
+  <table class="infobox"><tr><td>Not the data</td></tr></table>
+  <table class="wikitable sortable">
+    <tbody>
+      <tr><th>Name</th><th>Type</th><th>Type</th><th>Tributary of</th><th>Start</th><th>End</th></tr>
+      <tr><td><a href="/wiki/Lake_A">Lake A</a></td><td>Lake</td><td></td><td>River B</td><td>York County</td><td>York County</td></tr>
+      <tr><td>River B</td><td> River </td><td>Main</td><td>Bay of Fundy</td><td>Carleton County</td><td>Saint John County</td></tr>
+    </tbody>
+  </table>
+  <table class="wikitable"><tr><th>Other</th></tr><tr><td>Other table</td></tr></table>
+</body></html>
+"""
+
+WATERS_NO_TBODY_HTML = """
+<html><body>
+  <table class="wikitable">
+    <tr><th>Name</th><th>Type</th><th>Type</th><th>Tributary of</th><th>Start</th><th>End</th></tr>
+    <tr><td>Lake A</td><td>Lake</td><td></td><td>River B</td><td>York County</td><td>York County</td></tr>
+  </table>
+</body></html>
+"""
+
+WATERS_MISSING_COLUMNS_HTML = """
+<html><body>
+  <table class="wikitable">
+    <tr><th>Name</th><th>Type</th><th>Type</th><th>Tributary of</th><th>Start</th><th>End</th></tr>
+    <tr><td colspan="6">Lakes</td></tr>
+    <tr><td>Lake A</td><td>Lake</td><td></td><td>River B</td><td>York County</td><td>York County</td></tr>
+    <tr><td>Lake X</td><td>Lake</td></tr>
+  </table>
+</body></html>
+"""
+
+WATERS_NO_TABLE_HTML = "<html><body><p>No table here.</p></body></html>"
+
+# Water records are frozen, so the expected rows can be shared by every case.
+LAKE_A_ROW = Water(name="Lake A", type_1="Lake", type_2="", parent="River B",
+                   start_county="York County", end_county="York County")
+RIVER_B_ROW = Water(name="River B", type_1="River", type_2="Main", parent="Bay of Fundy",
+                    start_county="Carleton County", end_county="Saint John County")
+
+WATERS_CASES = [
+  pytest.param(WATERS_HTML, [LAKE_A_ROW, RIVER_B_ROW], id="basic"),
+  pytest.param(WATERS_NO_TBODY_HTML, [LAKE_A_ROW], id="no_tbody"),
+  pytest.param(WATERS_MISSING_COLUMNS_HTML, [LAKE_A_ROW], id="missing_columns"),
+  pytest.param(WATERS_NO_TABLE_HTML, [], id="no_table"),
+]
+
+
+@pytest.fixture(scope="module")
+def soup(request):
+  # Parametrized indirectly with the HTML of a case.
+  return _soup(request.param)
+
+
+@pytest.fixture(scope="module")
+def lxml_tree(request):
+  # Parametrized indirectly with the HTML of a case. A parser instance of its own, rather than
+  # lxml's shared default one.
+  return lxml.html.fromstring(request.param, parser=lxml.html.HTMLParser())
+
+
+def iterparse_rows(html):
+  return UnintrusivePageScraper._iterparse_rows(io.BytesIO(html.encode('utf-8')))
+
+
+@pytest.mark.xdist_group("example")
+class TestExampleComStrategy:
+
+  @pytest.mark.parametrize("soup,expected", EXAMPLE_CASES, indirect=["soup"])
+  def test_parse(self, example_strategy, soup, expected):
+    assert EXAMPLE_FIELDS(example_strategy.parse(soup)) == expected
+
+
+@pytest.mark.xdist_group("waters")
+class TestWatersStrategy:
+
+  @pytest.mark.parametrize("soup,expected", WATERS_CASES, indirect=["soup"])
+  def test_parse(self, waters_strategy, soup, expected):
+    assert waters_strategy.parse(soup) == expected
+
+  @pytest.mark.parametrize("html,expected", WATERS_CASES)
+  def test_parse_strained_soup(self, waters_strategy, html, expected):
+    # The scraper builds the soup with the strategy's parse_only strainer (wikitables only).
+    assert waters_strategy.parse(_soup(html, parse_only=waters_strategy.parse_only)) == expected
+
+  @pytest.mark.parametrize("html,expected", WATERS_CASES)
+  def test_parse_rows_matches_parse(self, waters_strategy, html, expected):
+    assert waters_strategy.parse_rows(iterparse_rows(html)) == expected
+
+  @pytest.mark.parametrize("lxml_tree,expected", WATERS_CASES, indirect=["lxml_tree"])
+  def test_parse_rows_from_lxml_tree(self, waters_strategy, lxml_tree, expected):
+    # parse_rows works on the rows of an already parsed lxml tree as well, without BeautifulSoup.
+    assert waters_strategy.parse_rows(lxml_tree.iter('tr')) == expected
+
+  def test_parse_rows_stops_after_target_table(self, waters_strategy):
+    rows = iterparse_rows(WATERS_HTML)
+    waters_strategy.parse_rows(rows)
+    # Only the first row of the second wikitable was consumed.
+    assert [row.findtext('td') for row in rows] == ["Other table"]